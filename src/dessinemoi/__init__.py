@@ -1,28 +1,86 @@
-from typing import Any  # noqa: I001
+import _thread  # noqa: I001
+from typing import TYPE_CHECKING, Any
+
+# -- Version information -------------------------------------------------------
+
+from ._version import version as __version__
 
 # -- Public API ----------------------------------------------------------------
 
-from ._core import Factory, FactoryRegistryEntry, LazyType
+# Core components are imported upon first access: this avoids importing attrs
+# when only the version is requested.
 
-# -- Version information -------------------------------------------------------
+if TYPE_CHECKING:
+    from ._core import (
+        Factory,
+        FactoryRegistryEntry,
+        LazyType,
+        register_mapping_type,
+    )
 
-from ._version import version as __version__
+    factory = Factory()
+    registry = factory.registry
+    register = factory.register
+    create = factory.create
+    convert = factory.convert
 
-# -- API to built-in factory instance ------------------------------------------
+_CORE_NAMES = {
+    "Factory",
+    "FactoryRegistryEntry",
+    "LazyType",
+    "register_mapping_type",
+}
+_FACTORY_NAMES = {"register", "create", "convert"}
 
-factory = Factory()
+# Guards the creation of the built-in factory: concurrent first accesses must
+# not create distinct instances (_thread is built in, unlike threading)
+_factory_lock = _thread.allocate_lock()
 
 
-def __getattr__(name: str) -> Any:
+def _factory():
+    # Get the built-in factory instance, creating it if necessary
     try:
-        return {
-            "registry": factory.registry,
-            "register": factory.register,
-            "create": factory.create,
-            "convert": factory.convert,
-        }[name]
+        return globals()["factory"]
     except KeyError:
-        raise AttributeError(name)
+        return __getattr__("factory")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _CORE_NAMES:
+        from . import _core
+
+        value = getattr(_core, name)
+
+    # -- API to built-in factory instance --------------------------------------
+
+    elif name == "factory":
+        from ._core import Factory
+
+        with _factory_lock:
+            # Another thread may have created the factory while we were waiting
+            try:
+                return globals()["factory"]
+            except KeyError:
+                value = Factory()
+                globals()[name] = value
+
+    elif name in _FACTORY_NAMES:
+        value = getattr(_factory(), name)
+
+    elif name == "registry":
+        # The registry is looked up dynamically because it may be reassigned
+        return _factory().registry
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the loaded object: subsequent lookups will not hit this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
@@ -30,5 +88,10 @@ __all__ = [
     "Factory",
     "FactoryRegistryEntry",
     "LazyType",
+    "register_mapping_type",
     "factory",
+    "registry",
+    "register",
+    "create",
+    "convert",
 ]
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
 import importlib
+import sys
 from collections.abc import MutableMapping
-from copy import copy
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import attrs
 
@@ -11,10 +28,24 @@ import attrs
 
 
 class _Missing:
-    pass
+    __slots__ = ()
 
+    def __repr__(self):
+        return "<MISSING>"
 
-_MISSING = _Missing
+
+_MISSING: Final = _Missing()
+
+# -- Known mapping types -------------------------------------------------------
+
+# Types known to be mutable mappings: checking membership is much cheaper than
+# the MutableMapping ABC instance check. See register_mapping_type().
+_MAPPING_TYPES = {dict}
+
+# -- Empty cache placeholder ---------------------------------------------------
+
+# Shared by registries until their caches are populated
+_EMPTY_CACHE: Final = MappingProxyType({})
 
 
 # -- Utilities -----------------------------------------------------------------
@@ -34,42 +65,92 @@ def _fullname(cls):
         return f"{mod}.{cls.__qualname__}"
 
 
+def register_mapping_type(cls: Type) -> None:
+    """
+    Register a mutable mapping type to be detected by :meth:`Factory.convert`
+    without going through the :class:`~collections.abc.MutableMapping` instance
+    check. This speeds up the conversion of mapping types other than
+    :class:`dict`, which is always registered.
+
+    :param cls:
+        Mutable mapping type to register. Only types whose instances are
+        always mutable mappings should be registered.
+
+    :raises TypeError:
+        If ``cls`` is not a subclass of
+        :class:`~collections.abc.MutableMapping`.
+
+    .. versionadded:: 24.2.0
+    """
+    if not (isinstance(cls, type) and issubclass(cls, MutableMapping)):
+        raise TypeError(f"{cls} is not a mutable mapping type")
+
+    _MAPPING_TYPES.add(cls)
+
+
+def _intern(type_id):
+    """
+    Intern a type ID string so that registry lookups with interned strings
+    (*e.g.* literals) hit the identity fast path.
+    """
+    return sys.intern(type_id) if type(type_id) is str else type_id
+
+
 # -- Core components -----------------------------------------------------------
 
 
+class _LazyTypeSlots:
+    # Values derived from LazyType fields: they are stored in slots declared
+    # outside of the attrs class so that they do not show up as attrs fields
+    __slots__ = {
+        "fullname": """
+            Fully qualified name of the object.
+
+            .. versionchanged:: 24.2.0
+               Converted from a property to an attribute set upon
+               initialization.
+            """,
+        "_loaded": "Loaded type, ``None`` until :meth:`LazyType.load` is called.",
+    }
+
+
 @attrs.frozen
-class LazyType:
+class LazyType(_LazyTypeSlots):
     """
     A lightweight data class specifying a lazily loaded type.
 
     .. versionadded:: 22.1.0
     """
 
-    mod: str = attrs.field(validator=attrs.validators.instance_of(str))
+    mod: str = attrs.field()
     """
     Module where the imported object will be looked up.
     """
 
-    attr: str = attrs.field(validator=attrs.validators.instance_of(str))
+    attr: str = attrs.field()
     """
     Name of the imported object.
     """
 
-    @attr.validator
-    @mod.validator
-    def _validator(self, attribute, value):
-        if value == "":
-            raise ValueError(
-                f"while validating '{attribute.name}': got '{value}', "
-                "must be non-empty"
-            )
+    def __attrs_post_init__(self):
+        # Validate all fields at once: this is much cheaper than attrs validators
+        for name, value in (("mod", self.mod), ("attr", self.attr)):
+            if not isinstance(value, str):
+                raise TypeError(
+                    f"while validating '{name}': got {value!r}, must be a str"
+                )
+            if value == "":
+                raise ValueError(
+                    f"while validating '{name}': got '{value}', must be non-empty"
+                )
 
-    @property
-    def fullname(self):
-        """
-        Fully qualified name of the object.
-        """
-        return f"{self.mod}.{self.attr}"
+        # Precompute the fully qualified name, queried upon registration
+        object.__setattr__(self, "fullname", f"{self.mod}.{self.attr}")
+        object.__setattr__(self, "_loaded", None)
+
+    def __reduce__(self):
+        # Derived values are not part of the attrs state: reinitialize copies
+        return type(self), (self.mod, self.attr)
 
     @classmethod
     def from_str(cls, value: str) -> LazyType:
@@ -100,17 +181,26 @@ class LazyType:
 
     def load(self) -> Type:
         """
-        Import the specified lazy type.
+        Import the specified lazy type. The imported type is cached, so that
+        subsequent calls do not import it again.
 
         :return:
             Imported type.
+
+        .. versionchanged:: 24.2.0
+           Cache the imported type.
         """
-        mod = importlib.import_module(self.mod)
-        return getattr(mod, self.attr)
+        loaded = self._loaded
+
+        if loaded is None:
+            mod = importlib.import_module(self.mod)
+            loaded = getattr(mod, self.attr)
+            object.__setattr__(self, "_loaded", loaded)
 
+        return loaded
 
-@attrs.define
-class FactoryRegistryEntry:
+
+class FactoryRegistryEntry(NamedTuple):
     """
     Data class holding a ``(cls: Type, dict_constructor: Optional[str])`` pair.
 
@@ -123,21 +213,142 @@ class FactoryRegistryEntry:
     constructor should be used.
 
     .. versionadded:: 21.3.0
+
+    .. versionchanged:: 24.2.0
+       Converted to a :class:`~typing.NamedTuple`: entries are now immutable.
     """
 
-    cls: Union[None, Type, LazyType] = attrs.field()
-    dict_constructor: Optional[str] = attrs.field()
+    cls: Union[None, Type, LazyType]
+    dict_constructor: Optional[str]
 
 
-@attrs.define
+class _Registry(dict):
+    """
+    Dictionary holding a factory's registry entries. In addition to the regular
+    dictionary interface, it maintains an index counting how many IDs reference
+    each registered type, which makes registered type lookup O(1).
+
+    The ``classes`` and ``builders`` mappings cache, for each type ID, the
+    resolved type and the callable used for dictionary conversion. They are
+    populated by the factory using :meth:`cache` and invalidated whenever the
+    corresponding entry is modified. Until then, they share a read-only empty
+    placeholder, so that registries never used for conversion do not allocate
+    them.
+    """
+
+    __slots__ = ("_fullnames", "_counts", "classes", "builders")
+
+    def __init__(self, *args, **kwargs):
+        # dict.__init__() is not called: entries are added by update() below
+        self._fullnames: Dict[str, str] = {}  # type ID -> type fullname
+        self._counts: Dict[str, int] = {}  # type fullname -> reference count
+        # type ID -> resolved type, type ID -> dict constructor
+        self.classes: Mapping[str, Type] = _EMPTY_CACHE
+        self.builders: Mapping[str, Callable] = _EMPTY_CACHE
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+    @property
+    def fullnames(self) -> KeysView[str]:
+        """
+        Fully qualified names of currently registered types, without duplicates.
+        """
+        return self._counts.keys()
+
+    def _index(self, key: str, fullname: str) -> None:
+        self._fullnames[key] = fullname
+        self._counts[fullname] = self._counts.get(fullname, 0) + 1
+
+    def cache(self, key: str, cls: Type, build: Callable) -> None:
+        """
+        Cache the resolved type and dict constructor for a type ID.
+        """
+        if self.builders is _EMPTY_CACHE:
+            self.classes, self.builders = {}, {}
+        self.classes[key] = cls
+        self.builders[key] = build
+
+    def _unindex(self, key: str) -> None:
+        if key in self.builders:
+            del self.classes[key]
+            del self.builders[key]
+        fullname = self._fullnames.pop(key)
+        count = self._counts[fullname] - 1
+        if count:
+            self._counts[fullname] = count
+        else:
+            del self._counts[fullname]
+
+    def replace(self, old: FactoryRegistryEntry, new: FactoryRegistryEntry) -> None:
+        """
+        Replace ``old`` with ``new`` for all IDs referencing ``old``.
+        """
+        for key in [key for key, entry in self.items() if entry is old]:
+            self[key] = new
+
+    def __setitem__(self, key: str, value: FactoryRegistryEntry) -> None:
+        # Resolve the name first: invalid entries must leave the registry as is
+        fullname = _fullname(value.cls)
+        if key in self:
+            self._unindex(key)
+        super().__setitem__(key, value)
+        self._index(key, fullname)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._unindex(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, key, *args):
+        if key in self:
+            self._unindex(key)
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._unindex(key)
+        return key, value
+
+    def clear(self) -> None:
+        super().clear()
+        self._fullnames.clear()
+        self._counts.clear()
+        self.classes = self.builders = _EMPTY_CACHE
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+def _to_registry(value) -> _Registry:
+    return value if isinstance(value, _Registry) else _Registry(value)
+
+
+@attrs.define(eq=False)
 class Factory:
-    registry: Dict[str, FactoryRegistryEntry] = attrs.field(factory=dict)
+    registry: _Registry = attrs.field(factory=_Registry, converter=_to_registry)
     """
     Dictionary holding the factory registry.
 
     .. versionchanged:: 21.3.0
        Changed type from ``Dict[str, Type]`` to
        ``Dict[str, FactoryRegistryEntry]``.
+
+    .. versionchanged:: 24.2.0
+       Assigned values are copied to a dictionary subclass which keeps track
+       of registered types: registrations are no longer reflected in the
+       dictionary passed by the user.
     """
 
     @property
@@ -147,7 +358,7 @@ class Factory:
 
         .. versionadded:: 21.3.0
         """
-        return list({_fullname(x.cls) for x in self.registry.values()})
+        return list(self.registry.fullnames)
 
     def _register_impl(
         self,
@@ -167,39 +378,36 @@ class Factory:
 
         # If no ID is specified and the type declares one, use it
         if type_id is None:
-            try:
-                type_id = cls._TYPE_ID
-            except AttributeError as e:
-                raise ValueError(
-                    f"while registering {cls}: please declare a type ID"
-                ) from e
+            type_id = getattr(cls, "_TYPE_ID", _MISSING)
+            if type_id is _MISSING:
+                raise ValueError(f"while registering {cls}: please declare a type ID")
+
+        registry = self.registry
 
         # Check if type is already registered
         cls_fullname = _fullname(cls)
-        if not aliases and cls_fullname in self.registered_types:
+        if not aliases and cls_fullname in registry.fullnames:
             raise ValueError(f"'{cls_fullname}' is already registered")
 
         # Check if ID is already used
-        if not overwrite_id and type_id in self.registry.keys():
-            raise ValueError(
-                f"'{type_id}' is already used to reference "
-                f"'{_fullname(self.registry[type_id].cls)}'"
-            )
+        if not overwrite_id:
+            existing = registry.get(type_id)
+            if existing is not None:
+                raise ValueError(
+                    f"'{type_id}' is already used to reference "
+                    f"'{_fullname(existing.cls)}'"
+                )
 
         # Check that dict constructor exists (skipped with lazy types)
         if isinstance(cls, type) and dict_constructor is not None:
-            try:
-                getattr(cls, dict_constructor)
-            except AttributeError as e:
+            if not hasattr(cls, dict_constructor):
                 raise ValueError(
                     f"class method '{cls.__name__}.{dict_constructor}()' does not exist"
-                ) from e
+                )
 
         # All checks done: perform actual registration
-        self.registry[type_id] = FactoryRegistryEntry(
-            cls=cls,
-            dict_constructor=dict_constructor,
-        )
+        type_id = _intern(type_id)
+        registry[type_id] = FactoryRegistryEntry(cls, dict_constructor)
 
         # Add aliases
         if aliases is None:
@@ -275,30 +483,45 @@ class Factory:
         """
 
         if cls is not _MISSING:
-            try:
-                return self._register_impl(
-                    cls,
-                    type_id=type_id,
-                    dict_constructor=dict_constructor,
-                    aliases=aliases,
-                    overwrite_id=overwrite_id,
-                    allow_lazy=allow_lazy,
-                )
-            except ValueError:
-                raise
+            return self._register_impl(
+                cls,
+                type_id=type_id,
+                dict_constructor=dict_constructor,
+                aliases=aliases,
+                overwrite_id=overwrite_id,
+                allow_lazy=allow_lazy,
+            )
 
         else:
+            return self._register_decorator(
+                type_id=type_id,
+                dict_constructor=dict_constructor,
+                aliases=aliases,
+                overwrite_id=overwrite_id,
+                allow_lazy=allow_lazy,
+            )
 
-            def inner_wrapper(wrapped_cls):
-                return self._register_impl(
-                    wrapped_cls,
-                    type_id=type_id,
-                    dict_constructor=dict_constructor,
-                    aliases=aliases,
-                    overwrite_id=overwrite_id,
-                )
+    def _register_decorator(
+        self,
+        *,
+        type_id: Optional[str] = None,
+        dict_constructor: Optional[str] = None,
+        aliases: Optional[List[str]] = None,
+        overwrite_id: bool = False,
+        allow_lazy: bool = True,
+    ) -> Any:
+        # Build a class decorator registering the decorated class
+        def inner_wrapper(wrapped_cls):
+            return self._register_impl(
+                wrapped_cls,
+                type_id=type_id,
+                dict_constructor=dict_constructor,
+                aliases=aliases,
+                overwrite_id=overwrite_id,
+                allow_lazy=allow_lazy,
+            )
 
-            return inner_wrapper
+        return inner_wrapper
 
     def alias(self, type_id: str, alias_id: str, overwrite_id: bool = False) -> None:
         """
@@ -321,18 +544,21 @@ class Factory:
 
         .. versionadded:: 22.2.0
         """
-        if type_id in self.registry:
-            if not overwrite_id and alias_id in self.registry.keys():
+        registry = self.registry
+
+        entry = registry.get(type_id)
+        if entry is None:
+            raise ValueError(f"cannot alias unregistered type '{type_id}'")
+
+        if not overwrite_id:
+            existing = registry.get(alias_id)
+            if existing is not None:
                 raise ValueError(
-                    f"'{type_id}' is already used to reference "
-                    f"'{_fullname(self.registry[type_id].cls)}'"
+                    f"'{alias_id}' is already used to reference "
+                    f"'{_fullname(existing.cls)}'"
                 )
 
-            else:
-                self.registry[alias_id] = self.registry[type_id]
-
-        else:
-            raise ValueError(f"cannot alias unregistered type '{type_id}'")
+        registry[_intern(alias_id)] = entry
 
     def get_type(self, type_id: str) -> Type:
         """
@@ -347,13 +573,15 @@ class Factory:
 
         .. versionadded:: 22.1.1
         """
-        entry = self.registry[type_id]
+        return self._resolve(self.registry[type_id])
 
-        if isinstance(entry.cls, LazyType):
-            cls = entry.cls.load()
-            self.registry[type_id].cls = cls
-        else:
-            cls = entry.cls
+    def _resolve(self, entry: FactoryRegistryEntry) -> Type:
+        # Load lazy types and update the registry accordingly
+        cls = entry.cls
+
+        if isinstance(cls, LazyType):
+            cls = cls.load()
+            self.registry.replace(entry, entry._replace(cls=cls))
 
         return cls
 
@@ -400,10 +628,10 @@ class Factory:
         .. versionchanged:: 21.2.0
            Added ``construct`` keyword argument.
         """
-        try:
-            cls = self.get_type(type_id)
-        except KeyError as e:
-            raise ValueError(f"no type registered as '{type_id}'") from e
+        entry = self.registry.get(type_id)
+        if entry is None:
+            raise ValueError(f"no type registered as '{type_id}'")
+        cls = self._resolve(entry)
 
         if allowed_cls is not None and not issubclass(cls, allowed_cls):
             raise TypeError(
@@ -411,35 +639,59 @@ class Factory:
                 "any of its subtypes"
             )
 
-        if args is None:
-            args = tuple()
-        if kwargs is None:
-            kwargs = dict()
+        constructor = cls if construct is None else getattr(cls, construct)
 
-        if construct is not None:
-            return getattr(cls, construct)(*args, **kwargs)
+        # Only unpack passed arguments; args is neither tested for truth nor
+        # sized since it may be any iterable (e.g. a NumPy array, a generator)
+        if args is None:
+            return constructor(**kwargs) if kwargs else constructor()
         else:
-            return cls(*args, **kwargs)
+            return constructor(*args, **kwargs) if kwargs else constructor(*args)
 
     def _convert_impl(
         self,
         value,
         allowed_cls: Optional[Union[Type, Tuple[Type]]] = None,
+        mutate: bool = False,
     ) -> Any:
-        if isinstance(value, MutableMapping):
-            # Copy value to avoid unintended mutation
-            value_copy = copy(value)
-
-            # Query registry
-            type_id = value_copy.pop("type")
-
+        # Known mapping types are checked first to skip the costlier ABC
+        # instance check; plain dicts, by far the most common, come first
+        value_type = type(value)
+        if (
+            value_type is dict
+            or value_type in _MAPPING_TYPES
+            or isinstance(value, MutableMapping)
+        ):
             try:
-                entry = self.registry[type_id]
+                type_id = value.pop("type") if mutate else value["type"]
             except KeyError as e:
-                raise ValueError(f"no type registered as '{type_id}'") from e
+                raise ValueError("missing 'type' entry") from e
+
+            if mutate:
+                # Consume value: it is used directly as constructor arguments
+                kwargs = value
+            else:
+                # Collect constructor arguments without mutating value
+                kwargs = {k: v for k, v in value.items() if k != "type"}
+
+            # Look up the type and dict constructor, resolving them only once
+            registry = self.registry
+            build = registry.builders.get(type_id)
+
+            if build is None:
+                entry = registry.get(type_id)
+                if entry is None:
+                    raise ValueError(f"no type registered as '{type_id}'")
 
-            # Resolve lazy type if necessary
-            cls = entry.cls.load() if isinstance(entry.cls, LazyType) else entry.cls
+                cls = self._resolve(entry)  # Resolve lazy type if necessary
+                if entry.dict_constructor is None:
+                    build = cls
+                else:
+                    build = getattr(cls, entry.dict_constructor)
+                registry.cache(type_id, cls, build)
+
+            else:
+                cls = registry.classes[type_id]
 
             # Check if class is allowed
             if allowed_cls is not None and not issubclass(cls, allowed_cls):
@@ -448,9 +700,7 @@ class Factory:
                 )
 
             # Construct object
-            return self.create(
-                type_id, construct=entry.dict_constructor, kwargs=value_copy
-            )
+            return build(**kwargs)
 
         else:
             # Check if object has allowed type
@@ -465,6 +715,7 @@ class Factory:
         value: MutableMapping = _MISSING,
         *,
         allowed_cls: Optional[Union[Type, Tuple[Type]]] = None,
+        mutate: bool = False,
     ) -> Any:
         """
         Convert a dictionary to one of the types supported by the factory.
@@ -484,18 +735,97 @@ class Factory:
             and an exception will be raised if it does not have one of the
             allowed types.
 
+        :param mutate:
+            If ``True``, a dictionary ``value`` is consumed: its ``type`` entry
+            is popped and the dictionary itself is passed as keyword arguments
+            to the constructor. This saves a copy, but must only be used if
+            the caller does not use ``value`` afterwards.
+
         :return:
             Created object if ``value`` is a dictionary; ``value`` otherwise.
 
+        :raises ValueError:
+            If ``value`` is a dictionary with no ``type`` entry, or if its
+            ``type`` entry does not reference a registered type.
+
         :raises TypeError:
             If ``allowed_cls`` is specified and ``value.type`` refers to a
             disallowed type or ``type(value)`` is disallowed.
 
         .. versionchanged:: 21.3.0
            Made all args keyword-only except for ``value``.
+
+        .. versionchanged:: 24.2.0
+           Added ``mutate`` argument. A missing ``type`` entry raises a
+           :class:`ValueError` instead of a :class:`KeyError`.
         """
         if value is _MISSING:
-            return lambda x: self._convert_impl(value=x, allowed_cls=allowed_cls)
+            # Converters are called on every field assignment: bind the
+            # implementation once and pass arguments positionally
+            impl = self._convert_impl
+
+            def converter(value):
+                return impl(value, allowed_cls, mutate)
+
+            return converter
 
         else:
-            return self._convert_impl(value=value, allowed_cls=allowed_cls)
+            return self._convert_impl(value, allowed_cls, mutate)
+
+    def iter_convert(
+        self,
+        values: Iterable[Any],
+        *,
+        allowed_cls: Optional[Union[Type, Tuple[Type]]] = None,
+        mutate: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Lazily convert a sequence of values with :meth:`convert`.
+
+        :param values:
+            Values to attempt conversion of.
+
+        :param allowed_cls:
+            Types to restrict conversion to. See :meth:`convert`.
+
+        :param mutate:
+            If ``True``, converted dictionaries are consumed. See
+            :meth:`convert`.
+
+        :return:
+            An iterator over converted values.
+
+        .. versionadded:: 24.2.0
+        """
+        convert = self._convert_impl
+        for value in values:
+            yield convert(value, allowed_cls, mutate)
+
+    def convert_many(
+        self,
+        values: Iterable[Any],
+        *,
+        allowed_cls: Optional[Union[Type, Tuple[Type]]] = None,
+        mutate: bool = False,
+    ) -> List[Any]:
+        """
+        Convert a sequence of values with :meth:`convert`. Method lookups are
+        performed once for the whole sequence.
+
+        :param values:
+            Values to attempt conversion of.
+
+        :param allowed_cls:
+            Types to restrict conversion to. See :meth:`convert`.
+
+        :param mutate:
+            If ``True``, converted dictionaries are consumed. See
+            :meth:`convert`.
+
+        :return:
+            List of converted values.
+
+        .. versionadded:: 24.2.0
+        """
+        convert = self._convert_impl
+        return [convert(value, allowed_cls, mutate) for value in values]
@@ -1,3 +1,12 @@
+import copy
+import importlib
+import pickle
+import subprocess
+import sys
+from abc import ABC
+from collections import OrderedDict
+from datetime import datetime
+
 import attrs
 import pytest as pytest
 
@@ -5,17 +14,61 @@ import dessinemoi
 from dessinemoi import Factory, LazyType
 
 
-@pytest.fixture
-def factory():
+@pytest.fixture(scope="module")
+def module_factory():
     yield Factory()
 
 
+@pytest.fixture
+def factory(module_factory):
+    # Reuse the module-wide instance with a fresh registry
+    module_factory.registry.clear()
+    yield module_factory
+
+
 @attrs.define
 class LazyTypeTest:
     # Class for lazy type testing
     pass
 
 
+# Classes shared by tests, defined once to avoid rebuilding them in each test
+
+
+@attrs.frozen
+class Sheep:
+    # Keyword-constructible class with a dict constructor
+    _TYPE_ID = "sheep"
+    wool = attrs.field(default="some")
+
+    @classmethod
+    def merino(cls):
+        return cls(wool="lots")
+
+
+@attrs.frozen
+class Lamb(Sheep):
+    _TYPE_ID = "lamb"
+
+
+@attrs.frozen
+class AgedSheep:
+    # Class with positional arguments and a class method constructor
+    _TYPE_ID = "sheep"
+    age = attrs.field()
+    name = attrs.field()
+
+    @classmethod
+    def old(cls, name):
+        return cls(15, name)
+
+
+@attrs.frozen
+class Ram(AgedSheep):
+    _TYPE_ID = "ram"
+    name = attrs.field(default="Gorki")
+
+
 def test_factory_instantiate(factory):
     # A Factory instance can be created
     assert isinstance(factory, Factory)
@@ -32,13 +85,7 @@ def test_factory_register(factory):
         cls=Sheep, dict_constructor=None
     )
 
-    # Registering class again fails
-    with pytest.raises(ValueError):
-        factory.register(Sheep, type_id="mouton")
-
-    # Overwriting existing ID fails if not explicitly allowed
-    with pytest.raises(ValueError):
-        factory.register(int, type_id="sheep")
+    # Existing IDs can be overwritten if explicitly allowed
     factory.register(int, type_id="sheep", overwrite_id=True)
 
     # A new class can also be registered with a decorator
@@ -57,11 +104,80 @@ def test_factory_register(factory):
     assert factory.registry["agneau"].cls is Agneau
 
 
-def test_factory_alias(factory):
-    # Registering an alias to a nonexisting type fails
+@pytest.mark.parametrize(
+    "cls, kwargs",
+    [
+        (Sheep, {"type_id": "mouton"}),
+        (int, {"type_id": "sheep"}),
+        (object, {}),
+        (f"{__name__}.LazyTypeTest", {}),
+        (Lamb, {"dict_constructor": "foo"}),
+    ],
+    ids=[
+        "already_registered",
+        "id_overwrite",
+        "missing_id",
+        "lazy_missing_id",
+        "missing_dict_constructor",
+    ],
+)
+def test_factory_register_errors(factory, cls, kwargs):
+    factory.register(Sheep)
     with pytest.raises(ValueError):
-        factory.alias("lamb", "agneau")
+        factory.register(cls, **kwargs)
+
+
+def test_factory_registered_types(factory):
+    class Sheep:
+        _TYPE_ID = "sheep"
+
+    class Lamb:
+        _TYPE_ID = "lamb"
+
+    factory.register(Sheep, aliases=["mouton"])
+    factory.register(Lamb)
+    assert sorted(factory.registered_types) == [
+        f"{__name__}.{cls.__qualname__}" for cls in [Lamb, Sheep]
+    ]
+
+    # A type remains registered as long as an ID references it
+    del factory.registry["sheep"]
+    assert f"{__name__}.{Sheep.__qualname__}" in factory.registered_types
+
+    # Overwriting the last ID referencing a type unregisters it
+    factory.register(Lamb, type_id="mouton", aliases=["agneau"], overwrite_id=True)
+    assert factory.registered_types == [f"{__name__}.{Lamb.__qualname__}"]
 
+    # Overwriting an ID with an alias also unregisters the evicted type
+    factory.register(Sheep, type_id="sheep")
+    for alias_id in ["lamb", "mouton", "agneau"]:
+        factory.alias("sheep", alias_id, overwrite_id=True)
+    assert factory.registered_types == [f"{__name__}.{Sheep.__qualname__}"]
+
+    # Types removed from the registry can be registered again
+    factory.registry.clear()
+    assert factory.registered_types == []
+    factory.register(Sheep)
+    assert factory.registered_types == [f"{__name__}.{Sheep.__qualname__}"]
+
+    # Resolving a lazy type updates its registered name
+    factory.registry.clear()
+    factory.register("dessinemoi.Factory", type_id="factory", aliases=["usine"])
+    assert factory.registered_types == ["dessinemoi.Factory"]
+    factory.create("factory")
+    assert factory.registered_types == ["dessinemoi._core.Factory"]
+
+    # Invalid entries leave the registry untouched
+    with pytest.raises(AttributeError):
+        factory.registry["factory"] = int
+    with pytest.raises(AttributeError):
+        factory.registry.setdefault("sheep")
+    assert "sheep" not in factory.registry
+    assert factory.registry["factory"].cls is Factory
+    assert factory.registered_types == ["dessinemoi._core.Factory"]
+
+
+def test_factory_alias(factory):
     # Aliasing an existing type works as expected
     @factory.register(type_id="lamb")
     class Lamb:
@@ -71,10 +187,6 @@ def test_factory_alias(factory):
     assert "agneau" in factory.registry
     assert factory.registry["agneau"].cls is Lamb
 
-    # Aliasing a type with an existing type ID fails
-    with pytest.raises(ValueError):
-        factory.alias("lamb", "agneau")
-
     # Aliases can be defined upon registration
     factory.registry.clear()
     factory.register(Lamb, type_id="lamb", aliases=["agneau"])
@@ -82,11 +194,22 @@ def test_factory_alias(factory):
     assert factory.registry["agneau"].cls is Lamb
 
 
-def test_factory_lazy(factory):
-    # Lazy types must have non-empty names
-    with pytest.raises(ValueError):
-        LazyType("", "")
+@pytest.mark.parametrize(
+    "type_id, alias_id, match",
+    [
+        ("mouton", "agneau", "cannot alias unregistered type 'mouton'"),
+        ("sheep", "lamb", "'lamb' is already used"),
+    ],
+    ids=["unregistered", "id_overwrite"],
+)
+def test_factory_alias_errors(factory, type_id, alias_id, match):
+    factory.register(Sheep)
+    factory.register(Lamb)
+    with pytest.raises(ValueError, match=match):
+        factory.alias(type_id, alias_id)
+
 
+def test_factory_lazy_eager(factory):
     # Eager registration immediately dereferences a lazy type
     factory.register(
         f"{__name__}.LazyTypeTest",
@@ -95,58 +218,39 @@ def test_factory_lazy(factory):
     )
     assert factory.registry["lazy"].cls is LazyTypeTest
 
-    # A LazyType instance can be registered and is resolved upon call to create()
-    del factory.registry["lazy"]
-    factory.register(
-        LazyType(__name__, "LazyTypeTest"),
-        type_id="lazy",
-    )
-    assert isinstance(factory.registry["lazy"].cls, dessinemoi.LazyType)
+
+@pytest.mark.parametrize(
+    "cls",
+    [f"{__name__}.LazyTypeTest", LazyType(__name__, "LazyTypeTest")],
+    ids=["str", "lazy_type"],
+)
+def test_factory_lazy(factory, cls):
+    # Strings and LazyType instances can be registered and are resolved upon
+    # call to create()
+    factory.register(cls, type_id="lazy")
+    assert isinstance(factory.registry["lazy"].cls, LazyType)
     assert isinstance(factory.create("lazy"), LazyTypeTest)
     # After dereferencing, the lazy type is replaced by the actual type
     assert factory.registry["lazy"].cls is LazyTypeTest
 
-    # Strings are interpreted as lazy types
-    del factory.registry["lazy"]
-    factory.register(
-        f"{__name__}.LazyTypeTest",
-        type_id="lazy",
-        overwrite_id=True,
-    )
-    assert isinstance(factory.create("lazy"), LazyTypeTest)
 
-    del factory.registry["lazy"]
-    factory.register(
-        f"{__name__}.LazyTypeTest",
-        type_id="lazy",
-        overwrite_id=True,
-    )
-    assert isinstance(factory.create("lazy"), LazyTypeTest)
-
-    # Lazy types require an ID
-    with pytest.raises(ValueError):
-        factory.register(
-            f"{__name__}.LazyTypeTest",
-            overwrite_id=True,
-        )
+@pytest.mark.parametrize(
+    "mod, attr, exc",
+    [("", "", ValueError), ("datetime", "", ValueError), ("datetime", None, TypeError)],
+    ids=["empty", "empty_attr", "not_str"],
+)
+def test_lazy_type_errors(mod, attr, exc):
+    # Lazy types must have non-empty string names
+    with pytest.raises(exc):
+        LazyType(mod, attr)
 
 
 def test_factory_create(factory):
-    @factory.register
-    @attrs.frozen
-    class Sheep:
-        _TYPE_ID = "sheep"
-        age = attrs.field()
-        name = attrs.field()
-
-    @factory.register
-    @attrs.frozen
-    class Ram(Sheep):
-        _TYPE_ID = "ram"
-        name = attrs.field(default="Gorki")
+    factory.register(AgedSheep)
+    factory.register(Ram)
 
     # We can use the factory to instantiate new objects with positional arguments only
-    assert factory.create("sheep", args=(5, "Dolly")) == Sheep(5, "Dolly")
+    assert factory.create("sheep", args=(5, "Dolly")) == AgedSheep(5, "Dolly")
 
     # Keyword arguments are supported as well
     assert factory.create("ram", args=(7,)) == Ram(7, name="Gorki")
@@ -154,6 +258,15 @@ def test_factory_create(factory):
         7, name="Romuald"
     )
 
+    # Arguments may be any iterable and are not tested for truth
+    class Args(tuple):
+        def __bool__(self):
+            raise ValueError("ambiguous truth value")
+
+    assert factory.create("sheep", args=Args((5, "Dolly"))) == AgedSheep(5, "Dolly")
+    assert factory.create("ram", args=Args((7,))) == Ram(7, name="Gorki")
+    assert factory.create("ram", args=(x for x in [7])) == Ram(7, name="Gorki")
+
     # Unregistered type IDs raise
     with pytest.raises(ValueError):
         factory.create("mouton")
@@ -164,17 +277,22 @@ def test_factory_create(factory):
         factory.create("sheep", args=(5, "Dolly"), allowed_cls=Ram)
 
 
-def test_factory_classmethod(factory):
-    @factory.register
-    @attrs.frozen
-    class Sheep:
-        _TYPE_ID = "sheep"
-        age = attrs.field()
-        name = attrs.field()
+def test_factory_create_allowed_abc(factory):
+    class Animal(ABC):
+        pass
+
+    factory.register(Sheep)
+    with pytest.raises(TypeError):
+        factory.create("sheep", allowed_cls=Animal)
+
+    # Virtual subclasses registered after a failed check are accepted
+    Animal.register(Sheep)
+    assert factory.create("sheep", allowed_cls=Animal) == Sheep()
+    assert factory.convert({"type": "sheep"}, allowed_cls=Animal) == Sheep()
 
-        @classmethod
-        def old(cls, name):
-            return cls(15, name)
+
+def test_factory_classmethod(factory):
+    factory.register(AgedSheep)
 
     # The construct parameter allows for the selection of a class method constructor
     s = factory.create("sheep", construct="old", kwargs={"name": "Romuald"})
@@ -182,21 +300,26 @@ def test_factory_classmethod(factory):
 
 
 def test_convert(factory):
-    @factory.register
-    @attrs.frozen
-    class Sheep:
-        _TYPE_ID = "sheep"
-        wool = attrs.field(default="some")
-
-    @factory.register
-    @attrs.frozen
-    class Lamb(Sheep):
-        _TYPE_ID = "lamb"
+    factory.register(Sheep)
+    factory.register(Lamb)
 
     # We can construct keyword-only classes from a dictionary using a converter
     merino = factory.convert({"type": "sheep", "wool": "a_lot"})
     assert merino == Sheep(wool="a_lot")
 
+    # The converted dictionary is not mutated
+    value = {"type": "sheep", "wool": "a_lot"}
+    factory.convert(value)
+    assert value == {"type": "sheep", "wool": "a_lot"}
+
+    # Upon request, the converted dictionary is consumed
+    value = {"type": "sheep", "wool": "a_lot"}
+    assert factory.convert(value, mutate=True) == merino
+    assert value == {"wool": "a_lot"}
+
+    # Other mapping types are supported
+    assert factory.convert(OrderedDict(type="sheep", wool="a_lot")) == merino
+
     # Objects other than dictionaries are not modified
     assert factory.convert(merino) is merino
 
@@ -204,6 +327,10 @@ def test_convert(factory):
     with pytest.raises(ValueError):
         factory.convert({"type": "bull"})
 
+    # Omitting the type raises a ValueError
+    with pytest.raises(ValueError):
+        factory.convert({"wool": "a_lot"})
+
     # Conversion can be restricted to a specific type
     with pytest.raises(TypeError):
         assert factory.convert(Sheep(), allowed_cls=Lamb)
@@ -213,6 +340,21 @@ def test_convert(factory):
         assert factory.convert({"type": "sheep"}, allowed_cls=Lamb)
     assert factory.convert({"type": "lamb"}, allowed_cls=Lamb) == Lamb()
 
+    # Sequences of values can be converted in one call
+    values = [{"type": "sheep"}, {"type": "lamb"}, Lamb()]
+    assert factory.convert_many(values) == [Sheep(), Lamb(), Lamb()]
+    assert list(factory.iter_convert(values)) == [Sheep(), Lamb(), Lamb()]
+    with pytest.raises(TypeError):
+        factory.convert_many(values, allowed_cls=Lamb)
+    # -- Dictionaries are only consumed upon request
+    assert values[0] == {"type": "sheep"}
+    values = [{"type": "sheep"}, {"type": "lamb"}]
+    assert factory.convert_many(values, mutate=True) == [Sheep(), Lamb()]
+    assert values == [{}, {}]
+    values = [{"type": "sheep"}, {"type": "lamb"}]
+    assert list(factory.iter_convert(values, mutate=True)) == [Sheep(), Lamb()]
+    assert values == [{}, {}]
+
     # The convert method can be turned into a converter (in the sense of attrs)
     converter = factory.convert(allowed_cls=Lamb)
     with pytest.raises(TypeError):
@@ -220,34 +362,75 @@ def test_convert(factory):
     assert converter({"type": "lamb"}) == Lamb()
 
 
-def test_module_api():
-    # Module has a default Factory instance
-    assert isinstance(dessinemoi.factory, Factory)
+@pytest.fixture(scope="module")
+def global_sheep():
+    # Register the shared Sheep class to the built-in factory
+    dessinemoi.register(Sheep, overwrite_id=True)
+    yield Sheep
+    dessinemoi.registry.pop("sheep", None)
 
-    # Module allows direct access to factory instance API
-    @dessinemoi.register
-    @attrs.frozen
-    class Sheep:
-        _TYPE_ID = "sheep"
-        wool = attrs.field(default="some")
 
-    assert dessinemoi.create("sheep") == Sheep()
-    assert dessinemoi.convert({"type": "sheep"}) == Sheep()
+class _Proxy:
+    # Proxy type reporting the class of the wrapped object
+    def __init__(self, wrapped):
+        object.__setattr__(self, "_wrapped", wrapped)
 
+    @property
+    def __class__(self):
+        return self._wrapped.__class__
 
-def test_factory_dict_constructor(factory):
-    @attrs.define
-    class Sheep:
-        wool = attrs.field()
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
 
-        @classmethod
-        def merino(cls):
-            return cls(wool="lots")
+    def __getitem__(self, key):
+        return self._wrapped[key]
+
+
+def test_convert_mapping_types(factory, monkeypatch):
+    # Registered mapping types are module-wide: restore them upon exit
+    monkeypatch.setattr(dessinemoi._core, "_MAPPING_TYPES", {dict})
+    factory.register(Sheep)
+
+    # Proxies are detected based on the type of the object they wrap
+    assert factory.convert(_Proxy({"type": "sheep"})) == Sheep()
+    proxied = _Proxy(Sheep())
+    assert factory.convert(proxied) is proxied
+
+    # Registered mapping types are converted
+    class SheepDict(OrderedDict):
+        pass
+
+    dessinemoi.register_mapping_type(SheepDict)
+    assert dessinemoi._core._MAPPING_TYPES == {dict, SheepDict}
+    assert factory.convert(SheepDict(type="sheep")) == Sheep()
+
+    # Only mutable mapping types can be registered
+    with pytest.raises(TypeError):
+        dessinemoi.register_mapping_type(Sheep)
+
+
+def test_module_lazy_import():
+    # Reading the version does not import core components
+    code = (
+        "import sys, dessinemoi; dessinemoi.__version__; print('attrs' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
 
-    # A non-existing dict constructor will raise
-    with pytest.raises(ValueError):
-        factory.register(Sheep, type_id="sheep", dict_constructor="foo")
 
+def test_module_api(global_sheep):
+    # Module has a default Factory instance
+    assert isinstance(dessinemoi.factory, Factory)
+
+    # Module allows direct access to factory instance API
+    assert dessinemoi.registry["sheep"].cls is global_sheep
+    assert dessinemoi.create("sheep") == global_sheep()
+    assert dessinemoi.convert({"type": "sheep"}) == global_sheep()
+
+
+def test_factory_dict_constructor(factory):
     # The dict constructor is correctly registered
     factory.register(Sheep, type_id="sheep", dict_constructor="merino")
 
@@ -256,25 +439,63 @@ def test_factory_dict_constructor(factory):
     s = factory.convert({"type": "sheep"})
     assert s == Sheep(wool="lots")
 
+    # Re-registering a type updates the dict constructor
+    del factory.registry["sheep"]
+    factory.register(Sheep, type_id="sheep")
+    assert factory.convert({"type": "sheep", "wool": "little"}) == Sheep(wool="little")
 
-def test_lazy_type():
-    from datetime import datetime
 
+def test_lazy_type_load(monkeypatch):
     # Lazy types are dereferenced upon call to load()
-    lazy_datetime = dessinemoi.LazyType("datetime", "datetime")
+    lazy_datetime = LazyType("datetime", "datetime")
     assert lazy_datetime.load() is datetime
+    assert lazy_datetime.fullname == "datetime.datetime"
+    assert lazy_datetime == LazyType("datetime", "datetime")
+    # -- Derived values are not attrs fields
+    assert attrs.asdict(lazy_datetime) == {"mod": "datetime", "attr": "datetime"}
 
-    # String-based constructor tests
-    # -- Standard pattern: absolute path
-    assert dessinemoi.LazyType.from_str("foo.bar") == dessinemoi.LazyType(
-        mod="foo", attr="bar"
-    )
-    # -- Absolute path with nested submodules
-    assert dessinemoi.LazyType.from_str("foo.bar.baz") == dessinemoi.LazyType(
-        mod="foo.bar", attr="baz"
+    # -- The loaded type is cached: the module is not imported again
+    def import_module(name):
+        raise ImportError(f"unexpected import of {name!r}")
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    assert lazy_datetime.load() is datetime
+    with pytest.raises(ImportError):
+        LazyType("datetime", "datetime").load()
+
+
+@pytest.mark.parametrize(
+    "copy_func",
+    [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_lazy_type_copy(factory, copy_func):
+    # Copies of lazy types load the target type, whether loaded or not
+    lazy_datetime = LazyType("datetime", "datetime")
+    assert copy_func(lazy_datetime).load() is datetime
+    lazy_datetime.load()
+    assert copy_func(lazy_datetime).load() is datetime
+
+    # Lazy registry entries of copied factories can be resolved
+    factory.register("datetime.datetime", type_id="datetime")
+    assert copy_func(factory).create("datetime", args=(2024, 1, 1)) == datetime(
+        2024, 1, 1
     )
-    # -- Relative imports are not allowed
-    with pytest.raises(ValueError):
-        dessinemoi.LazyType.from_str("foo")
+
+
+@pytest.mark.parametrize(
+    "value, mod, attr",
+    [("foo.bar", "foo", "bar"), ("foo.bar.baz", "foo.bar", "baz")],
+    ids=["absolute", "nested"],
+)
+def test_lazy_type_from_str(value, mod, attr):
+    # Lazy types can be constructed from absolute paths, including with nested
+    # submodules
+    assert LazyType.from_str(value) == LazyType(mod=mod, attr=attr)
+
+
+@pytest.mark.parametrize("value", ["foo", ".foo"])
+def test_lazy_type_from_str_errors(value):
+    # Relative imports are not allowed
     with pytest.raises(ValueError):
-        dessinemoi.LazyType.from_str(".foo")
+        LazyType.from_str(value)